@@ -1,21 +1,96 @@
 """Audio capture and processing utilities."""
 
 import logging
+import math
 import queue
 import threading
+import time
 from typing import Iterator
 
 import numpy as np
 import sounddevice as sd
+from numba import njit
 
 from .config import CHANNELS, CHUNK_SIZE, SAMPLE_RATE
 
 logger = logging.getLogger(__name__)
 
 
+class _ChunkRing:
+    """
+    Single-producer/single-consumer ring of preallocated audio chunks.
+
+    The audio callback copies into the next slot and advances the write
+    index; the reader copies out and advances the read index. Each index has
+    exactly one writer, so the realtime audio thread never allocates. The
+    only shared lock is the event the reader sleeps on while the ring is
+    empty, which the producer sets without ever waiting.
+    """
+
+    def __init__(self, slots: int, chunk_samples: int):
+        self._slots = [np.empty(chunk_samples, dtype=np.int16) for _ in range(slots)]
+        self._sizes = [0] * slots
+        self._write_index = 0
+        self._read_index = 0
+        self._ready = threading.Event()
+
+    def put(self, data) -> None:
+        """Copy a chunk of int16 samples into the next slot (producer side)."""
+        index = self._write_index % len(self._slots)
+        samples = _as_samples(data)
+        np.copyto(self._slots[index][: samples.size], samples)
+        self._sizes[index] = samples.size
+        self._write_index += 1
+        self._ready.set()
+
+    def get(self, timeout: float = None) -> np.ndarray:
+        """
+        Return the oldest unread chunk (consumer side).
+
+        Raises:
+            queue.Empty: If no chunk arrives within ``timeout`` seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        capacity = len(self._slots)
+        while True:
+            while self._read_index == self._write_index:
+                # Clear before re-checking so a put() in between still wakes us
+                self._ready.clear()
+                if self._read_index != self._write_index:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self._ready.wait(remaining)
+
+            # The slot at write_index % capacity may be mid-write, so at most
+            # capacity - 1 chunks behind the producer are safe to read
+            lag = self._write_index - self._read_index
+            if lag >= capacity:
+                logger.warning(f"Audio buffer overrun, dropped {lag - capacity + 1} chunks")
+                self._read_index = self._write_index - capacity + 1
+
+            index = self._read_index % capacity
+            chunk = self._slots[index][: self._sizes[index]].copy()
+            # The producer may have reached this slot mid-copy; retry if so
+            if self._write_index - self._read_index < capacity:
+                self._read_index += 1
+                return chunk
+
+    def drop_stale(self, keep: int) -> int:
+        """Skip all but the newest ``keep`` unread chunks (consumer side)."""
+        stale = self._write_index - self._read_index - keep
+        if stale <= 0:
+            return 0
+        self._read_index += stale
+        return stale
+
+
 class AudioStream:
     """Manages audio input stream from microphone."""
 
+    RING_SLOTS = 64  # Chunks buffered before the oldest are overwritten
+
     def __init__(
         self,
         sample_rate: int = SAMPLE_RATE,
@@ -25,7 +100,7 @@ class AudioStream:
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_size = chunk_size
-        self.audio_queue: queue.Queue = queue.Queue()
+        self._buffer = _ChunkRing(self.RING_SLOTS, chunk_size * channels)
         self.stream = None
         self._stop_event = threading.Event()
 
@@ -33,8 +108,9 @@ class AudioStream:
         """Callback for sounddevice stream."""
         if status:
             logger.warning(f"Audio stream status: {status}")
-        # Convert to bytes and put in queue
-        self.audio_queue.put(bytes(indata))
+        # indata is already an int16 array; copy it into a preallocated ring
+        # slot so the audio thread neither allocates nor parses bytes
+        self._buffer.put(indata)
 
     def start(self):
         """Start the audio stream."""
@@ -42,7 +118,7 @@ class AudioStream:
             f"Starting audio stream (rate={self.sample_rate}, "
             f"channels={self.channels}, chunk={self.chunk_size})"
         )
-        self.stream = sd.RawInputStream(
+        self.stream = sd.InputStream(
             samplerate=self.sample_rate,
             channels=self.channels,
             dtype="int16",
@@ -59,15 +135,28 @@ class AudioStream:
             self.stream.close()
             self.stream = None
 
-    def read(self) -> bytes:
-        """Read audio data from the queue."""
-        return self.audio_queue.get()
+    def read(self) -> np.ndarray:
+        """Read the next chunk of int16 samples from the buffer."""
+        return self._buffer.get()
+
+    def drop_backlog(self, max_duration: float) -> int:
+        """
+        Discard buffered audio older than the newest ``max_duration`` seconds.
 
-    def iter_audio(self) -> Iterator[bytes]:
+        Args:
+            max_duration: Seconds of the most recent audio to keep
+
+        Returns:
+            Number of chunks discarded
+        """
+        keep = math.ceil(max_duration * self.sample_rate / self.chunk_size)
+        return self._buffer.drop_stale(keep)
+
+    def iter_audio(self) -> Iterator[np.ndarray]:
         """Iterate over audio chunks."""
         while not self._stop_event.is_set():
             try:
-                chunk = self.audio_queue.get(timeout=0.1)
+                chunk = self._buffer.get(timeout=0.1)
                 yield chunk
             except queue.Empty:
                 continue
@@ -80,12 +169,104 @@ class AudioStream:
         self.stop()
 
 
-def calculate_energy(audio_data: bytes) -> float:
-    """Calculate the energy level of audio data."""
-    audio_array = np.frombuffer(audio_data, dtype=np.int16)
-    return float(np.sqrt(np.mean(audio_array**2)))
+def _as_samples(audio_data) -> np.ndarray:
+    """View raw int16 PCM bytes or an int16 array as a flat sample array."""
+    if isinstance(audio_data, np.ndarray):
+        return audio_data.reshape(-1)
+    return np.frombuffer(audio_data, dtype=np.int16)
+
 
+# numpy-rms was considered for the chunk energy but not adopted: its SIMD
+# kernel only accepts float32, so every int16 chunk would need a cast (an
+# extra allocation and pass) first, and it would add a dependency for a loop
+# Numba already compiles to the same single pass over the int16 samples.
+@njit(cache=True, fastmath=True)
+def _sum_squares_i16(samples: np.ndarray) -> int:
+    """Sum of squared int16 samples, accumulated in int64 in a single pass."""
+    total = np.int64(0)
+    for i in range(samples.size):
+        value = np.int64(samples[i])
+        total += value * value
+    return total
 
-def is_silence(audio_data: bytes, threshold: float = 500) -> bool:
+
+@njit(cache=True)
+def _sum_squares_below(samples: np.ndarray, bound: float) -> bool:
+    """
+    Check whether the sum of squared samples stays below ``bound``.
+
+    Accumulates in blocks so the inner loop still vectorizes, and returns as
+    soon as a block pushes the running total over the bound.
+    """
+    total = np.int64(0)
+    for start in range(0, samples.size, 512):
+        for i in range(start, min(start + 512, samples.size)):
+            value = np.int64(samples[i])
+            total += value * value
+        if total >= bound:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _copy_sum_squares(src: np.ndarray, dst: np.ndarray) -> int:
+    """Copy ``src`` into ``dst`` and return its sum of squares, in one pass."""
+    total = np.int64(0)
+    for i in range(src.size):
+        value = src[i]
+        dst[i] = value
+        wide = np.int64(value)
+        total += wide * wide
+    return total
+
+
+def calculate_energy(audio_data: bytes | np.ndarray) -> float:
+    """Calculate the energy level of audio data (raw int16 bytes or samples)."""
+    audio_array = _as_samples(audio_data)
+    if audio_array.size == 0:
+        return 0.0
+    return math.sqrt(_sum_squares_i16(audio_array) / audio_array.size)
+
+
+def is_silence(audio_data: bytes | np.ndarray, threshold: float = 500) -> bool:
     """Check if audio data is below the silence threshold."""
-    return calculate_energy(audio_data) < threshold
+    # rms < threshold  <=>  sum of squares < threshold**2 * n, without the sqrt
+    audio_array = _as_samples(audio_data)
+    if audio_array.size == 0:
+        return True
+    return _sum_squares_below(audio_array, float(threshold) ** 2 * audio_array.size)
+
+
+def store_samples(
+    audio_data: bytes | np.ndarray, out: np.ndarray, threshold: float = 500
+) -> tuple[int, bool]:
+    """
+    Copy a chunk into ``out`` and check it for silence in the same pass.
+
+    Equivalent to ``is_silence`` followed by a copy, but reads each sample
+    once instead of twice.
+
+    Args:
+        audio_data: Raw int16 PCM bytes or int16 samples
+        out: int16 destination; samples that do not fit are dropped
+        threshold: RMS level below which the chunk counts as silence
+
+    Returns:
+        Number of samples copied and whether the chunk is silence
+    """
+    audio_array = _as_samples(audio_data)[: out.size]
+    n = audio_array.size
+    if n == 0:
+        return 0, True
+    silent = _copy_sum_squares(audio_array, out) < float(threshold) ** 2 * n
+    return n, silent
+
+
+# Compile the kernels at import so the first chunk in the recording loop does
+# not pay the JIT latency. Buffers from np.frombuffer are read-only, which
+# Numba specializes on separately from writable arrays.
+for _warmup in (bytes(2), np.zeros(1, dtype=np.int16)):
+    calculate_energy(_warmup)
+    is_silence(_warmup)
+    store_samples(_warmup, np.empty(1, dtype=np.int16))
+del _warmup
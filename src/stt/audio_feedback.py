@@ -1,7 +1,10 @@
 """Audio feedback using system beeps and tones."""
 
+import atexit
+import functools
 import logging
 import platform
+import queue
 import subprocess
 import threading
 
@@ -12,6 +15,108 @@ from .config import SAMPLE_RATE
 
 logger = logging.getLogger(__name__)
 
+# Angular step per sample for a 1 Hz tone; scaled by frequency per tone
+_W0 = np.float32(2.0 * np.pi / SAMPLE_RATE)
+
+
+@functools.lru_cache(maxsize=16)
+def _tone(frequency: int, duration: float, volume: float) -> np.ndarray:
+    """Return a cached sine tone buffer for the given parameters."""
+    # Stay in float32 end to end and reuse one buffer for phase, sine and gain
+    tone = np.arange(int(SAMPLE_RATE * duration), dtype=np.float32)
+    tone *= _W0 * np.float32(frequency)
+    np.sin(tone, out=tone)
+    tone *= np.float32(volume)
+    # Shared between callers, so guard against accidental mutation
+    tone.flags.writeable = False
+    return tone
+
+
+def _chime(tones: tuple, gap: float = 0.02) -> np.ndarray:
+    """Join several tones, separated by short silences, into one buffer."""
+    silence = np.zeros(int(SAMPLE_RATE * gap), dtype=np.float32)
+    parts = []
+    for spec in tones:
+        if parts:
+            parts.append(silence)
+        parts.append(_tone(*spec))
+    chime = np.concatenate(parts)
+    chime.flags.writeable = False
+    return chime
+
+
+# Multi-beep sounds are played as a single buffer: one stream start/stop
+# instead of one per beep.
+_WAKE_CHIME = _chime(((600, 0.1, 0.3), (800, 0.1, 0.3)))
+_CLIPBOARD_CHIME = _chime(((1000, 0.08, 0.25), (1200, 0.08, 0.25), (1400, 0.08, 0.25)))
+
+
+# One output stream kept open for the process lifetime; opening a device per
+# beep costs tens of milliseconds before the first sample is audible.
+_output_stream = None
+_output_lock = threading.Lock()
+
+
+def _close_output_stream():
+    """Close the shared output stream so the next beep reopens it; hold _output_lock."""
+    global _output_stream
+    if _output_stream is not None:
+        try:
+            _output_stream.close()
+        finally:
+            _output_stream = None
+
+
+def _play(samples: np.ndarray):
+    """Write a float32 buffer to the shared output stream, blocking while it plays."""
+    global _output_stream
+    with _output_lock:
+        try:
+            if _output_stream is None:
+                _output_stream = sd.OutputStream(
+                    samplerate=SAMPLE_RATE, channels=1, dtype="float32"
+                )
+                _output_stream.start()
+            _output_stream.write(samples)
+        except Exception:
+            # Device may have changed or gone away; reopen on the next call
+            _close_output_stream()
+            raise
+
+
+def _shutdown_output_stream():
+    """Close the shared output stream once any in-progress write finishes."""
+    with _output_lock:
+        _close_output_stream()
+
+
+atexit.register(_shutdown_output_stream)
+
+# Non-blocking sounds are handed to a single daemon worker instead of
+# spawning a thread per sound
+_sound_queue: queue.Queue = queue.Queue()
+_sound_worker = None
+_sound_worker_lock = threading.Lock()
+
+
+def _sound_worker_loop():
+    """Play queued sounds one after another."""
+    for sound in iter(_sound_queue.get, None):
+        try:
+            sound()
+        except Exception as e:
+            logger.error(f"Failed to play queued sound: {e}")
+
+
+def _play_async(sound, *args):
+    """Queue a sound function for the background worker."""
+    global _sound_worker
+    with _sound_worker_lock:
+        if _sound_worker is None:
+            _sound_worker = threading.Thread(target=_sound_worker_loop, daemon=True)
+            _sound_worker.start()
+    _sound_queue.put(functools.partial(sound, *args))
+
 
 def play_beep(frequency: int = 800, duration: float = 0.15, volume: float = 0.3):
     """
@@ -23,13 +128,7 @@ def play_beep(frequency: int = 800, duration: float = 0.15, volume: float = 0.3)
         volume: Volume (0.0 to 1.0)
     """
     try:
-        # Generate sine wave
-        t = np.linspace(0, duration, int(SAMPLE_RATE * duration), False)
-        tone = np.sin(frequency * 2 * np.pi * t) * volume
-
-        # Play the tone
-        sd.play(tone, SAMPLE_RATE)
-        sd.wait()
+        _play(_tone(frequency, duration, volume))
     except Exception as e:
         logger.error(f"Failed to play beep: {e}")
         # Fallback to system beep
@@ -38,10 +137,7 @@ def play_beep(frequency: int = 800, duration: float = 0.15, volume: float = 0.3)
 
 def play_beep_async(frequency: int = 800, duration: float = 0.15, volume: float = 0.3):
     """Play a beep without blocking."""
-    thread = threading.Thread(
-        target=play_beep, args=(frequency, duration, volume), daemon=True
-    )
-    thread.start()
+    _play_async(play_beep, frequency, duration, volume)
 
 
 def _system_beep():
@@ -62,26 +158,21 @@ def wake_word_detected_sound():
     """Play a rising tone when wake word is detected."""
     try:
         # Two-tone ascending beep
-        play_beep(frequency=600, duration=0.1, volume=0.3)
-        play_beep(frequency=800, duration=0.1, volume=0.3)
+        _play(_WAKE_CHIME)
     except Exception as e:
         logger.error(f"Failed to play wake word sound: {e}")
+        _system_beep()
 
 
 def clipboard_ready_sound():
     """Play a confirmation sound when text is copied to clipboard."""
     try:
         # Three quick beeps
-        for freq in [1000, 1200, 1400]:
-            t = np.linspace(0, 0.08, int(SAMPLE_RATE * 0.08), False)
-            tone = np.sin(freq * 2 * np.pi * t) * 0.25
-            sd.play(tone, SAMPLE_RATE)
-            sd.wait()
+        _play(_CLIPBOARD_CHIME)
     except Exception as e:
         logger.error(f"Failed to play clipboard sound: {e}")
 
 
 def clipboard_ready_sound_async():
     """Play clipboard ready sound without blocking."""
-    thread = threading.Thread(target=clipboard_ready_sound, daemon=True)
-    thread.start()
+    _play_async(clipboard_ready_sound)
@@ -1,13 +1,46 @@
 """Cross-platform clipboard operations."""
 
+import functools
 import logging
+import os
 import platform
+import shutil
 import subprocess
+import tempfile
 import time
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# The platform never changes at runtime; look it up once
+_SYSTEM = platform.system()
+
+
+def _resolve_commands(candidates: list) -> tuple:
+    """Keep the candidate commands whose binary exists, with absolute paths."""
+    commands = []
+    for command in candidates:
+        path = shutil.which(command[0])
+        if path:
+            commands.append([path, *command[1:]])
+    return tuple(commands)
+
+
+# Resolve clipboard tools once at import so each copy/paste skips the PATH
+# search and the FileNotFoundError round-trip for tools that are missing.
+if _SYSTEM == "Linux":
+    _WAYLAND = bool(os.environ.get("WAYLAND_DISPLAY"))
+    _LINUX_COPY_COMMANDS = _resolve_commands(
+        ([["wl-copy"]] if _WAYLAND else [])
+        + [["xclip", "-selection", "clipboard"], ["xsel", "--clipboard", "--input"]]
+    )
+    _LINUX_PASTE_COMMANDS = _resolve_commands(
+        ([["wl-paste", "--no-newline"]] if _WAYLAND else [])
+        + [["xclip", "-selection", "clipboard", "-o"], ["xsel", "--clipboard", "--output"]]
+    )
+else:
+    _LINUX_COPY_COMMANDS = _LINUX_PASTE_COMMANDS = ()
+
 
 def copy_to_clipboard(text: str) -> bool:
     """
@@ -26,17 +59,10 @@ def copy_to_clipboard(text: str) -> bool:
         logger.warning("Empty text provided, nothing to copy")
         return False
 
-    system = platform.system()
-    logger.debug(f"Detected platform: {system}")
+    logger.debug(f"Detected platform: {_SYSTEM}")
 
     try:
-        if system == "Darwin":  # macOS
-            return _copy_macos(text)
-        elif system == "Linux":
-            return _copy_linux(text)
-        else:
-            logger.warning(f"Unsupported platform: {system}, trying pyperclip")
-            return _copy_pyperclip(text)
+        return _COPY_BACKEND(text)
     except Exception as e:
         logger.error(f"Failed to copy to clipboard: {e}")
         # Try fallback to pyperclip
@@ -47,8 +73,33 @@ def copy_to_clipboard(text: str) -> bool:
             return False
 
 
+@functools.lru_cache(maxsize=1)
+def _macos_pasteboard():
+    """
+    Return the general NSPasteboard and its string type via PyObjC.
+
+    Talking to the pasteboard in-process avoids a fork+exec of pbcopy or
+    pbpaste per call. Returns None when AppKit is not installed.
+    """
+    try:
+        from AppKit import NSPasteboard, NSPasteboardTypeString
+    except ImportError:
+        logger.debug("AppKit not available, using pbcopy/pbpaste")
+        return None
+    return NSPasteboard.generalPasteboard(), NSPasteboardTypeString
+
+
 def _copy_macos(text: str) -> bool:
-    """Copy text to clipboard on macOS using pbcopy."""
+    """Copy text to clipboard on macOS using NSPasteboard or pbcopy."""
+    pasteboard = _macos_pasteboard()
+    if pasteboard is not None:
+        board, string_type = pasteboard
+        board.clearContents()
+        if board.setString_forType_(text, string_type):
+            logger.info("Text copied to clipboard (macOS/AppKit)")
+            return True
+        logger.warning("NSPasteboard rejected text, trying pbcopy")
+
     process = subprocess.Popen(
         ["pbcopy"], stdin=subprocess.PIPE, stderr=subprocess.PIPE
     )
@@ -63,42 +114,34 @@ def _copy_macos(text: str) -> bool:
 
 
 def _copy_linux(text: str) -> bool:
-    """Copy text to clipboard on Linux using xclip or xsel."""
-    # Try xclip first
-    try:
-        process = subprocess.Popen(
-            ["xclip", "-selection", "clipboard"],
-            stdin=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        stdout, stderr = process.communicate(text.encode("utf-8"))
+    """Copy text to clipboard on Linux using wl-copy, xclip or xsel."""
+    if not _LINUX_COPY_COMMANDS:
+        logger.error("None of wl-copy, xclip or xsel found on Linux system")
+        return False
 
-        if process.returncode == 0:
-            logger.info("Text copied to clipboard (Linux/xclip)")
-            return True
-        else:
-            logger.warning(f"xclip failed: {stderr.decode()}")
-    except FileNotFoundError:
-        logger.debug("xclip not found, trying xsel")
+    # Encode once; the same bytes are fed to each fallback tool
+    data = text.encode("utf-8")
+    for command in _LINUX_COPY_COMMANDS:
+        tool = os.path.basename(command[0])
+        # Capture no pipes: xclip and wl-copy fork a child that keeps serving
+        # the selection with the inherited stdout/stderr, so a pipe would not
+        # reach EOF until another app takes the clipboard. stderr goes to a
+        # temporary file instead, which never blocks the exit.
+        with tempfile.TemporaryFile() as stderr:
+            result = subprocess.run(
+                command,
+                input=data,
+                stderr=stderr,
+                check=False,
+            )
 
-    # Try xsel as fallback
-    try:
-        process = subprocess.Popen(
-            ["xsel", "--clipboard", "--input"],
-            stdin=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        stdout, stderr = process.communicate(text.encode("utf-8"))
+            if result.returncode == 0:
+                logger.info(f"Text copied to clipboard (Linux/{tool})")
+                return True
+            stderr.seek(0)
+            logger.warning(f"{tool} failed: {stderr.read().decode()}")
 
-        if process.returncode == 0:
-            logger.info("Text copied to clipboard (Linux/xsel)")
-            return True
-        else:
-            logger.error(f"xsel failed: {stderr.decode()}")
-            return False
-    except FileNotFoundError:
-        logger.error("Neither xclip nor xsel found on Linux system")
-        return False
+    return False
 
 
 def _copy_pyperclip(text: str) -> bool:
@@ -124,17 +167,10 @@ def get_clipboard_content() -> Optional[str]:
     Returns:
         Clipboard text content or None if failed
     """
-    system = platform.system()
-    logger.debug(f"Getting clipboard content from platform: {system}")
+    logger.debug(f"Getting clipboard content from platform: {_SYSTEM}")
 
     try:
-        if system == "Darwin":  # macOS
-            return _get_macos()
-        elif system == "Linux":
-            return _get_linux()
-        else:
-            logger.warning(f"Unsupported platform: {system}, trying pyperclip")
-            return _get_pyperclip()
+        return _GET_BACKEND()
     except Exception as e:
         logger.error(f"Failed to get clipboard content: {e}")
         # Try fallback to pyperclip
@@ -146,7 +182,14 @@ def get_clipboard_content() -> Optional[str]:
 
 
 def _get_macos() -> Optional[str]:
-    """Get clipboard content on macOS using pbpaste."""
+    """Get clipboard content on macOS using NSPasteboard or pbpaste."""
+    pasteboard = _macos_pasteboard()
+    if pasteboard is not None:
+        board, string_type = pasteboard
+        content = board.stringForType_(string_type)
+        logger.info("Got clipboard content (macOS/AppKit)")
+        return None if content is None else str(content)
+
     try:
         result = subprocess.run(
             ["pbpaste"],
@@ -165,33 +208,17 @@ def _get_macos() -> Optional[str]:
 
 
 def _get_linux() -> Optional[str]:
-    """Get clipboard content on Linux using xclip or xsel."""
-    # Try xclip first
-    try:
-        result = subprocess.run(
-            ["xclip", "-selection", "clipboard", "-o"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        logger.info("Got clipboard content (Linux/xclip)")
-        return result.stdout
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        logger.debug("xclip failed, trying xsel")
+    """Get clipboard content on Linux using wl-paste, xclip or xsel."""
+    for command in _LINUX_PASTE_COMMANDS:
+        tool = os.path.basename(command[0])
+        result = subprocess.run(command, capture_output=True, text=True, check=False)
+        if result.returncode == 0:
+            logger.info(f"Got clipboard content (Linux/{tool})")
+            return result.stdout
+        logger.debug(f"{tool} failed: {result.stderr}")
 
-    # Try xsel as fallback
-    try:
-        result = subprocess.run(
-            ["xsel", "--clipboard", "--output"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        logger.info("Got clipboard content (Linux/xsel)")
-        return result.stdout
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        logger.error("Neither xclip nor xsel could get clipboard content")
-        return None
+    logger.error("None of wl-paste, xclip or xsel could get clipboard content")
+    return None
 
 
 def _get_pyperclip() -> Optional[str]:
@@ -210,49 +237,73 @@ def _get_pyperclip() -> Optional[str]:
         return None
 
 
+# Virtual key code for "v" on macOS (kVK_ANSI_V)
+_MACOS_KEYCODE_V = 9
+
+
+def _paste_quartz():
+    """Send Cmd+V on macOS as native Quartz keyboard events."""
+    import Quartz
+
+    source = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateHIDSystemState)
+    for key_down in (True, False):
+        event = Quartz.CGEventCreateKeyboardEvent(source, _MACOS_KEYCODE_V, key_down)
+        Quartz.CGEventSetFlags(event, Quartz.kCGEventFlagMaskCommand)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+
+def _paste_xtest():
+    """Send Ctrl+V on X11 through the XTEST extension."""
+    from Xlib import X, XK, display
+    from Xlib.ext import xtest
+
+    conn = display.Display()
+    try:
+        ctrl = conn.keysym_to_keycode(XK.XK_Control_L)
+        v = conn.keysym_to_keycode(XK.XK_v)
+        for event_type, keycode in (
+            (X.KeyPress, ctrl),
+            (X.KeyPress, v),
+            (X.KeyRelease, v),
+            (X.KeyRelease, ctrl),
+        ):
+            xtest.fake_input(conn, event_type, keycode)
+        conn.sync()
+    finally:
+        conn.close()
+
+
 def paste_at_cursor() -> bool:
     """
     Paste clipboard content at the current cursor position.
 
-    Uses keyboard automation to simulate Cmd+V (macOS) or Ctrl+V (Linux/Windows).
+    Uses keyboard automation to simulate Cmd+V (macOS) or Ctrl+V (Linux/Windows),
+    preferring native Quartz/XTEST events over pyautogui.
 
     Returns:
         True if successful, False otherwise
     """
-    system = platform.system()
-    logger.debug(f"Pasting at cursor on platform: {system}")
+    logger.debug(f"Pasting at cursor on platform: {_SYSTEM}")
 
-    if system == "Darwin":  # macOS
-        # Try AppleScript first as it's more reliable on macOS
+    # Native key events: the OS queues them in order, so no sleeps are needed
+    if _NATIVE_PASTE is not None:
         try:
-            # Use keystroke command which works better with accessibility
-            script = '''
-            tell application "System Events"
-                keystroke "v" using command down
-            end tell
-            '''
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                timeout=2
-            )
-            if result.returncode == 0:
-                logger.info("Pasted using AppleScript")
-                return True
-            else:
-                logger.warning(f"AppleScript paste failed: {result.stderr}")
+            _NATIVE_PASTE()
+            logger.info("Pasted clipboard content at cursor using native key events")
+            return True
+        except ImportError as e:
+            logger.debug(f"Native key events unavailable: {e}")
         except Exception as e:
-            logger.warning(f"AppleScript method failed: {e}")
+            logger.warning(f"Native paste failed: {e}")
 
-    # Try pyautogui as fallback or for non-macOS
+    # Try pyautogui as last resort
     try:
         import pyautogui
 
         # Longer delay to ensure focus
         time.sleep(0.2)
 
-        if system == "Darwin":  # macOS
+        if _SYSTEM == "Darwin":  # macOS
             # Press and hold Command, press v, release both
             pyautogui.keyDown('command')
             time.sleep(0.05)
@@ -275,3 +326,13 @@ def paste_at_cursor() -> bool:
     except Exception as e:
         logger.error(f"Failed to paste at cursor: {e}")
         return False
+
+
+# Platform backends, selected once at import instead of on every call
+if _SYSTEM == "Darwin":  # macOS
+    _COPY_BACKEND, _GET_BACKEND, _NATIVE_PASTE = _copy_macos, _get_macos, _paste_quartz
+elif _SYSTEM == "Linux":
+    _COPY_BACKEND, _GET_BACKEND, _NATIVE_PASTE = _copy_linux, _get_linux, _paste_xtest
+else:
+    logger.warning(f"Unsupported platform: {_SYSTEM}, using pyperclip")
+    _COPY_BACKEND, _GET_BACKEND, _NATIVE_PASTE = _copy_pyperclip, _get_pyperclip, None
@@ -15,12 +15,19 @@ CHUNK_SIZE = 8000  # Process audio in chunks
 # Recording configuration
 SILENCE_THRESHOLD = 5  # Energy threshold for silence detection (lowered for sensitive mics)
 SILENCE_DURATION = 2.0  # Seconds of silence before stopping recording
-MAX_RECORDING_DURATION = 30.0  # Maximum recording duration in seconds
+MAX_RECORDING_DURATION = 30.0  # Maximum recording duration in seconds (capped at 30 s with the whisper backend)
 MIN_RECORDING_DURATION = 0.5  # Minimum recording duration in seconds
 
 # Auto-calibration
 AUTO_CALIBRATE_THRESHOLD = True  # Automatically adjust threshold based on ambient noise
 
+# Voice activity detection
+# True: decide speech vs. silence with the Silero VAD model instead of the
+#   energy threshold, so no calibration is needed; requires the "vad" extra
+#   (uv sync --extra vad)
+USE_VAD = False
+VAD_THRESHOLD = 0.5  # Speech probability above which a frame counts as speech
+
 # Whisper model configuration
 # Options: "tiny", "base", "small", "medium", "large"
 # tiny: fastest, least accurate (~75MB)
@@ -28,5 +35,26 @@ AUTO_CALIBRATE_THRESHOLD = True  # Automatically adjust threshold based on ambie
 # small: better accuracy (~500MB)
 WHISPER_MODEL = "base"  # Default model size
 
+# Model used to spot the wake/paste words in 2-second windows while idle.
+# A tiny English-only model is plenty for a single keyword and keeps the
+# always-on loop cheap; set to None to reuse WHISPER_MODEL.
+TRIGGER_WORD_MODEL = "tiny.en"
+
+# Number of trigger-word windows the whisper backend decodes together in one
+# batch. Larger batches keep a GPU busier but can delay detection by that many
+# windows (a silent window decodes whatever is queued); 1 disables batching.
+TRIGGER_BATCH_SIZE = 1
+
+# Inference backend
+# "whisper": OpenAI reference implementation (PyTorch)
+# "faster_whisper": CTranslate2 implementation with quantized kernels, several
+#   times faster; requires the "faster" extra (uv sync --extra faster)
+WHISPER_BACKEND = "whisper"
+
+# Weight quantization applied at load time by the faster_whisper backend
+# "int8": int8 weights (int8 activations on CPU, float16 on GPU) - smallest, fastest
+# None: keep the converted model's float16/float32 weights
+WHISPER_QUANTIZATION = "int8"
+
 # Logging
 LOG_LEVEL = os.getenv("STT_LOG_LEVEL", "INFO")
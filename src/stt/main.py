@@ -1,18 +1,19 @@
 """Main entry point for the speech-to-text application."""
 
 import logging
-import os
 import sys
 import threading
 
 from colorama import Fore, Style, init
-from pynput import keyboard
 
-from .audio import AudioStream
-from .audio_feedback import clipboard_ready_sound_async, wake_word_detected_sound
 from .clipboard import copy_to_clipboard, get_clipboard_content, paste_at_cursor
 from .config import LOG_LEVEL, PASTE_WORD, WAKE_WORD, WHISPER_MODEL
-from .transcribe import SpeechRecognizer
+
+# pynput, sounddevice, numba and whisper/torch are imported lazily inside the
+# functions that need them so the banner appears before the heavy imports run
+
+# pynput.keyboard, bound once by run() before the key listener starts
+keyboard = None
 
 # Initialize colorama
 init(autoreset=True)
@@ -73,11 +74,14 @@ def on_release(key):
 
 def run():
     """Main application loop."""
+    global keyboard
     setup_logging()
     logger = logging.getLogger(__name__)
 
-    # Clear screen
-    os.system('clear' if os.name != 'nt' else 'cls')
+    # Clear screen with ANSI escapes (colorama translates them on legacy
+    # Windows consoles) instead of spawning a shell to run clear/cls
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
 
     print(f"{Fore.CYAN}{'=' * 60}")
     print(f"{Fore.CYAN}🎤  Speech-to-Text with Wake Word Detection")
@@ -89,12 +93,18 @@ def run():
     print(f"\n{Fore.MAGENTA}Press Ctrl+C to exit{Style.RESET_ALL}\n")
 
     try:
+        from pynput import keyboard
+
         # Start keyboard listener in background
         listener = keyboard.Listener(on_press=on_press, on_release=on_release)
         listener.start()
 
         # Initialize components (will download model on first run)
         print(f"{Fore.BLUE}Loading model...{Style.RESET_ALL}", end="", flush=True)
+        from .audio import AudioStream
+        from .audio_feedback import clipboard_ready_sound_async
+        from .transcribe import SpeechRecognizer
+
         recognizer = SpeechRecognizer()
         print(f"\r{Fore.GREEN}✓ Model loaded{Style.RESET_ALL}                    ")
 
@@ -1,17 +1,22 @@
 """Speech recognition and transcription using OpenAI Whisper."""
 
+import contextlib
+import dataclasses
 import io
 import logging
 import os
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import numpy as np
+import torch
 import whisper
 from colorama import Fore, Style
+from whisper.audio import HOP_LENGTH, N_FFT, N_FRAMES, N_SAMPLES, mel_filters
+from whisper.decoding import DecodingTask
 
-from .audio import AudioStream, calculate_energy
+from .audio import AudioStream, calculate_energy, store_samples
 from .audio_feedback import wake_word_detected_sound
 from .config import (
     AUTO_CALIBRATE_THRESHOLD,
@@ -21,45 +26,461 @@ from .config import (
     SAMPLE_RATE,
     SILENCE_DURATION,
     SILENCE_THRESHOLD,
+    TRIGGER_BATCH_SIZE,
+    TRIGGER_WORD_MODEL,
+    USE_VAD,
+    VAD_THRESHOLD,
     WAKE_WORD,
+    WHISPER_BACKEND,
     WHISPER_MODEL,
+    WHISPER_QUANTIZATION,
 )
 
 logger = logging.getLogger(__name__)
 
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+_VAD_FRAME = 512  # Samples per Silero VAD frame at 16 kHz
+
+# Temperatures transcribe() retries with, best of 5 samples each, when greedy
+# decoding looks like a repetition loop or a low-confidence guess
+_FALLBACK_TEMPERATURES = (0.2, 0.4, 0.6, 0.8, 1.0)
+
+
+def _to_float32(samples: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Normalize int16 samples to [-1, 1] float32 in a single pass.
+
+    Args:
+        samples: int16 samples
+        out: Optional float32 buffer to write into; only its first
+            ``samples.size`` entries are used
+
+    Returns:
+        The normalized samples
+    """
+    # Casting inside the ufunc avoids a separate astype() temporary
+    if out is None:
+        return np.multiply(samples, _INT16_SCALE, dtype=np.float32)
+    return np.multiply(samples, _INT16_SCALE, out=out[: samples.size])
+
+
+def _normalize_log_mel(mel_spec: torch.Tensor) -> torch.Tensor:
+    """Apply Whisper's log compression and dynamic-range normalization."""
+    log_spec = torch.clamp(mel_spec, min=1e-10).log10()
+    log_spec = torch.maximum(log_spec, log_spec.max() - 8.0)
+    return (log_spec + 4.0) / 4.0
+
+
+class _StreamingLogMel:
+    """
+    Builds Whisper's log-mel spectrogram incrementally while recording.
+
+    Whisper's features are the STFT of the clip zero-padded to 30 s, with
+    N_FFT // 2 samples of reflect padding on each side. Every frame depends
+    only on the N_FFT samples under its window, so its mel power can be
+    computed as soon as those samples arrive. Only the final log and
+    normalization need the whole clip, and they are cheap.
+    """
+
+    PAD = N_FFT // 2
+
+    def __init__(self, window: torch.Tensor, filters: torch.Tensor):
+        self._window = window
+        self._filters = filters
+        device = window.device
+        # Sample i of the clip lives at index PAD + i
+        self._padded = torch.zeros(N_SAMPLES + N_FFT, device=device)
+        self._mel = torch.zeros(filters.shape[0], N_FRAMES, device=device)
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a new clip."""
+        self._padded.zero_()
+        self._mel.zero_()
+        self._length = 0
+        self._frames = 0
+        self._reflected = False
+
+    def append(self, samples: np.ndarray) -> None:
+        """Add int16 samples and compute every frame they complete."""
+        n = min(samples.size, N_SAMPLES - self._length)
+        if n <= 0:
+            return
+        audio = torch.from_numpy(samples[:n]).to(self._window.device, non_blocking=True)
+        start = self.PAD + self._length
+        self._padded[start : start + n] = audio.float().mul_(float(_INT16_SCALE))
+        self._length += n
+        if self._length > self.PAD:
+            self._advance((self.PAD + self._length - N_FFT) // HOP_LENGTH + 1)
+
+    def finalize(self) -> torch.Tensor:
+        """Compute the remaining frames and return the normalized log-mel."""
+        # Right reflect padding mirrors the end of the 30 s window; it only
+        # differs from zeros when the clip fills that window
+        end = self.PAD + N_SAMPLES
+        self._padded[end:] = self._padded[end - self.PAD - 1 : end - 1].flip(0)
+        # Frames starting past the clip only see zero padding and keep mel 0
+        self._advance(-(-(self.PAD + self._length) // HOP_LENGTH))
+        return _normalize_log_mel(self._mel)
+
+    def _advance(self, frames: int) -> None:
+        if not self._reflected:
+            # Left reflect padding mirrors samples 1..PAD of the padded clip
+            self._padded[: self.PAD] = self._padded[self.PAD + 1 : 2 * self.PAD + 1].flip(0)
+            self._reflected = True
+        frames = min(frames, N_FRAMES)
+        if frames <= self._frames:
+            return
+        lo = self._frames * HOP_LENGTH
+        hi = (frames - 1) * HOP_LENGTH + N_FFT
+        stft = torch.stft(
+            self._padded[lo:hi],
+            N_FFT,
+            HOP_LENGTH,
+            window=self._window,
+            center=False,
+            return_complex=True,
+        )
+        self._mel[:, self._frames : frames] = self._filters @ (stft.abs() ** 2)
+        self._frames = frames
+
 
 class SpeechRecognizer:
     """Handles speech recognition using OpenAI Whisper."""
 
-    def __init__(self, model_name: str = WHISPER_MODEL):
+    def __init__(self, model_name: str = WHISPER_MODEL, backend: str = WHISPER_BACKEND):
         """Initialize the speech recognizer with a Whisper model."""
-        logger.info(f"Loading Whisper model: {model_name}")
+        # Opened once and reused to swallow progress bars and warnings
+        self._devnull = open(os.devnull, "w")
+
+        logger.info(f"Loading Whisper model: {model_name} ({backend})")
         logger.info(
             "First run will download the model. This may take a few minutes..."
         )
-        self.model = whisper.load_model(model_name)
+        if backend == "faster_whisper":
+            try:
+                import faster_whisper  # noqa: F401
+            except ImportError:
+                logger.warning("faster-whisper not installed, using openai-whisper")
+                backend = "whisper"
+
+        self.backend = backend
+        self.model = self._load_model(model_name)
+        if TRIGGER_WORD_MODEL and TRIGGER_WORD_MODEL != model_name:
+            logger.info(f"Loading trigger word model: {TRIGGER_WORD_MODEL}")
+            self.trigger_model = self._load_model(TRIGGER_WORD_MODEL)
+        else:
+            self.trigger_model = self.model
+
+        if backend == "whisper":
+            # Feature extraction constants, built once instead of per clip,
+            # and kept on the model's device so the spectrogram runs there too
+            device = self.model.device
+            self._window = torch.hann_window(N_FFT, device=device)
+            self._mel_filters = {
+                model.dims.n_mels: mel_filters(device, model.dims.n_mels)
+                for model in (self.model, self.trigger_model)
+            }
+            # Decoding options, tokenizer, SOT prefix and logit filters are the
+            # same for every clip; DecodingTask.run() resets its own state
+            options = whisper.DecodingOptions(
+                language="en",
+                fp16=device.type == "cuda",
+                without_timestamps=True,
+            )
+            self._decoding_tasks = {
+                model: DecodingTask(model, options)
+                for model in (self.model, self.trigger_model)
+            }
+            self._decoding_options = options
+            # Sampling tasks for the main model, built on first use
+            self._fallback_tasks = {}
+            # Trigger-word spectrograms waiting to be decoded as one batch
+            if TRIGGER_BATCH_SIZE > 1:
+                self._pending_mels = []
+                # Partial batches are padded with silence so the encoder
+                # always sees one input shape
+                self._pad_mel = self._compute_log_mel(
+                    np.zeros(1, dtype=np.int16), self.trigger_model.dims.n_mels
+                )
+            else:
+                self._pending_mels = None
+            if device.type == "cuda":
+                self._compile_encoders()
+            # Features for the main model are built while recording
+            self._streaming_mel = _StreamingLogMel(
+                self._window, self._mel_filters[self.model.dims.n_mels]
+            )
+            # One worker keeps spectrogram updates in order while the
+            # recording loop goes straight back to reading audio
+            self._feature_worker = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="stt-features"
+            )
+        else:
+            self._streaming_mel = None
+            self._feature_worker = None
+            self._pending_mels = None
         logger.info("Model loaded successfully")
 
         self.silence_threshold = SILENCE_THRESHOLD
         self.calibrated = False
+        self._vad = self._load_vad() if USE_VAD else None
+        self._reset_vad()
+
+        # Recording buffer reused by every capture, so no per-chunk list and
+        # no final join copy; also bounds a recording to one Whisper window
+        buffer_size = int(MAX_RECORDING_DURATION * SAMPLE_RATE)
+        if backend == "whisper" and buffer_size > N_SAMPLES:
+            # Clips are decoded as a single window, so audio past it is lost
+            logger.warning(
+                f"MAX_RECORDING_DURATION of {MAX_RECORDING_DURATION}s exceeds "
+                f"Whisper's {N_SAMPLES // SAMPLE_RATE}s window; recordings are "
+                f"capped at {N_SAMPLES // SAMPLE_RATE}s with the whisper backend"
+            )
+            buffer_size = N_SAMPLES
+        if backend == "whisper" and self.model.device.type == "cuda":
+            # Page-locked memory turns the non_blocking uploads to the GPU
+            # into asynchronous DMA copies instead of staged synchronous ones
+            self._rec_buf = torch.empty(
+                buffer_size, dtype=torch.int16, pin_memory=True
+            ).numpy()
+        else:
+            self._rec_buf = np.empty(buffer_size, dtype=np.int16)
+        # faster-whisper takes float32 input on the host; convert into one
+        # reused buffer instead of allocating a fresh array per clip
+        if backend == "faster_whisper":
+            self._audio_f32 = np.empty(self._rec_buf.size, dtype=np.float32)
+        else:
+            self._audio_f32 = None
+
+    def _load_model(self, model_name: str):
+        """Load a model for the configured backend."""
+        if self.backend == "faster_whisper":
+            return self._load_ctranslate2(model_name)
+        return whisper.load_model(model_name)
+
+    @staticmethod
+    def _load_ctranslate2(model_name: str):
+        """Load a faster-whisper model, quantizing its weights on load."""
+        import ctranslate2
+        from faster_whisper import WhisperModel
+
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        if WHISPER_QUANTIZATION is None:
+            compute_type = "default"
+        elif device == "cuda":
+            # Quantized weights with float16 activations for tensor cores
+            compute_type = f"{WHISPER_QUANTIZATION}_float16"
+        else:
+            compute_type = WHISPER_QUANTIZATION
+        logger.info(f"CTranslate2 device={device}, compute_type={compute_type}")
+        return WhisperModel(model_name, device=device, compute_type=compute_type)
+
+    @staticmethod
+    def _load_vad():
+        """Load the Silero voice activity detector, or None if unavailable."""
+        try:
+            from silero_vad import load_silero_vad
+        except ImportError:
+            logger.warning("silero-vad not installed, using the energy threshold")
+            return None
+        logger.info("Loading Silero VAD")
+        return load_silero_vad()
+
+    def _compile_encoders(self) -> None:
+        """torch.compile the audio encoders and warm them up."""
+        # Only the encoder is compiled: its input is always one padded 30 s
+        # window, so it compiles exactly once. The decoder's KV-cache hooks and
+        # growing sequence length would force recompiles on every token.
+        models = [self.model]
+        if self.trigger_model is not self.model:
+            models.append(self.trigger_model)
+
+        logger.info("Compiling Whisper encoders (one-time)...")
+        for model in models:
+            model.encoder = torch.compile(model.encoder, mode="reduce-overhead")
+        # Pay compilation here rather than on the first real utterance
+        silence = np.zeros(SAMPLE_RATE, dtype=np.int16)
+        for model in models:
+            self._transcribe(model, silence)
+        if self._pending_mels is not None:
+            # Batched trigger windows are a second, fixed encoder shape
+            self._decode_trigger_batch([])
+
+    def _transcribe(self, model, samples: np.ndarray) -> str:
+        """Run ``model`` on int16 samples and return the raw text."""
+        if self.backend == "faster_whisper":
+            # Greedy decoding, matching openai-whisper's transcribe() default
+            segments, _ = model.transcribe(
+                _to_float32(samples, self._audio_f32), language="en", beam_size=1
+            )
+            return "".join(segment.text for segment in segments)
+
+        return self._decode(model, self._compute_log_mel(samples, model.dims.n_mels))
+
+    def _decode(self, model, mel: torch.Tensor, fallback: bool = False) -> str:
+        """
+        Decode a single 30 s log-mel window with an openai-whisper model.
+
+        Args:
+            model: Whisper model to decode with
+            mel: Log-mel spectrogram of the window
+            fallback: Retry at higher temperatures like transcribe() does
+
+        Returns:
+            The decoded text
+        """
+        # Clips fit in a single 30 s window, so decode it directly instead of
+        # going through transcribe()'s sliding-window machinery
+        mel = mel.unsqueeze(0)
+        with torch.no_grad():
+            result = self._decoding_tasks[model].run(mel)[0]
+            if fallback:
+                for temperature in _FALLBACK_TEMPERATURES:
+                    if not self._needs_fallback(result):
+                        break
+                    result = self._fallback_task(model, temperature).run(mel)[0]
+        return self._result_text(result)
+
+    def _fallback_task(self, model, temperature: float) -> DecodingTask:
+        """Sampling DecodingTask for ``model`` at ``temperature``, built once."""
+        key = (model, temperature)
+        if key not in self._fallback_tasks:
+            options = dataclasses.replace(
+                self._decoding_options, temperature=temperature, best_of=5
+            )
+            self._fallback_tasks[key] = DecodingTask(model, options)
+        return self._fallback_tasks[key]
+
+    @staticmethod
+    def _needs_fallback(result) -> bool:
+        """Apply transcribe()'s thresholds for retrying a decode."""
+        # Confident silence is accepted as is rather than resampled
+        if result.no_speech_prob > 0.6 and result.avg_logprob < -1.0:
+            return False
+        return result.compression_ratio > 2.4 or result.avg_logprob < -1.0
+
+    @staticmethod
+    def _result_text(result) -> str:
+        """Text of a decoding result, dropping windows judged to be no speech."""
+        # Same no-speech rule transcribe() applies to each segment
+        if result.no_speech_prob > 0.6 and result.avg_logprob < -1.0:
+            return ""
+        return result.text
+
+    def _compute_log_mel(self, samples: np.ndarray, n_mels: int) -> torch.Tensor:
+        """Whisper log-mel spectrogram of a clip padded to the 30 s window."""
+        # Ship the compact int16 samples and normalize on the model's device
+        audio = torch.from_numpy(samples).to(self._window.device, non_blocking=True)
+        audio = whisper.pad_or_trim(audio.float().mul_(float(_INT16_SCALE)))
+        stft = torch.stft(
+            audio, N_FFT, HOP_LENGTH, window=self._window, return_complex=True
+        )
+        magnitudes = stft[..., :-1].abs() ** 2
+        return _normalize_log_mel(self._mel_filters[n_mels] @ magnitudes)
+
+    @contextlib.contextmanager
+    def _silenced(self):
+        """Temporarily redirect stderr to devnull."""
+        old_stderr = sys.stderr
+        sys.stderr = self._devnull
+        try:
+            yield
+        finally:
+            sys.stderr = old_stderr
+
+    def _store_chunk(self, pos: int, chunk: np.ndarray) -> tuple[int, bool]:
+        """
+        Copy a chunk into the recording buffer at ``pos``.
+
+        Returns:
+            The new end of the recording and whether the chunk is silence
+        """
+        n, silent = store_samples(chunk, self._rec_buf[pos:], self.silence_threshold)
+        return pos + n, silent
+
+    def _reset_vad(self) -> None:
+        """Start scoring a new capture from the beginning of the recording buffer."""
+        # Next unscored sample in the recording buffer, and the last decision
+        self._vad_pos = 0
+        self._vad_speech = False
+        if self._vad is not None:
+            self._vad.reset_states()
+
+    def _is_speech(self, end: int, silent: bool) -> bool:
+        """
+        Decide whether the newest chunk, ending at ``end``, contains speech.
+
+        Args:
+            end: End of the stored audio in the recording buffer
+            silent: Result of the energy check made while storing the chunk
+
+        Returns:
+            True if the VAD (or, without one, the energy check) found speech
+        """
+        if self._vad is None:
+            return not silent
+        # Silero takes fixed-size frames. Score every whole frame since the
+        # last call; a partial frame waits for the next chunk to complete it,
+        # so every sample is scored and the detector's context stays contiguous
+        n = (end - self._vad_pos) // _VAD_FRAME * _VAD_FRAME
+        if n == 0:
+            return self._vad_speech
+        samples = self._rec_buf[self._vad_pos : self._vad_pos + n]
+        self._vad_pos += n
+        frames = torch.from_numpy(_to_float32(samples))
+        with torch.no_grad():
+            probability = max(
+                self._vad(frame, SAMPLE_RATE).item()
+                for frame in frames.view(-1, _VAD_FRAME)
+            )
+        self._vad_speech = probability > VAD_THRESHOLD
+        return self._vad_speech
+
+    def _record_window(self, audio_stream: AudioStream, duration: float) -> tuple[int, bool]:
+        """
+        Fill the recording buffer with a fixed amount of audio.
+
+        The window is measured in samples rather than wall-clock time, so it
+        always covers ``duration`` seconds of audio. Audio queued for longer
+        than one window (left over from a slow decode) is skipped first, so
+        the detector never falls further behind the microphone.
+
+        Args:
+            audio_stream: AudioStream object providing audio data
+            duration: Window length in seconds
+
+        Returns:
+            Number of samples stored and whether any chunk was above the
+            silence threshold
+        """
+        target = min(int(duration * audio_stream.sample_rate), self._rec_buf.size)
+        dropped = audio_stream.drop_backlog(duration)
+        if dropped:
+            logger.debug(f"Skipped {dropped} stale audio chunks")
+        pos = 0
+        has_audio = False
+        self._reset_vad()
+        while pos < target:
+            end, silent = self._store_chunk(pos, audio_stream.read())
+            has_audio = has_audio or self._is_speech(end, silent)
+            pos = end
+        return pos, has_audio
 
     def calibrate_threshold(self, audio_stream: AudioStream) -> None:
         """Calibrate the silence threshold based on ambient noise."""
-        if not AUTO_CALIBRATE_THRESHOLD or self.calibrated:
+        # The VAD needs no threshold
+        if not AUTO_CALIBRATE_THRESHOLD or self.calibrated or self._vad is not None:
             return
 
         print(f"{Fore.BLUE}Calibrating...{Style.RESET_ALL}", end="", flush=True)
 
-        energy_samples = []
-        start_time = time.time()
+        pos, _ = self._record_window(audio_stream, 2.0)
 
-        while time.time() - start_time < 2.0:
-            audio_data = audio_stream.read()
-            energy = calculate_energy(audio_data)
-            energy_samples.append(energy)
-
-        if energy_samples:
-            avg_noise = np.mean(energy_samples)
+        if pos:
+            # One energy pass over the whole calibration window
+            avg_noise = calculate_energy(self._rec_buf[:pos])
             # Set threshold to 1.5x the average noise level, with a minimum
             self.silence_threshold = max(3, int(avg_noise * 1.5))
             print(f"\r{Fore.GREEN}✓ Calibrated{Style.RESET_ALL} (threshold: {self.silence_threshold})       ")
@@ -78,9 +499,19 @@ class SpeechRecognizer:
         """
         logger.info("Starting transcription...")
 
-        audio_chunks = []
+        # Silence and length are counted in samples, like the buffer cap, so
+        # they stay correct while a backlog is being read faster than real time
+        pos = 0
         silence_start = None
-        recording_start = time.time()
+        silence_samples = int(SILENCE_DURATION * audio_stream.sample_rate)
+        min_samples = int(MIN_RECORDING_DURATION * audio_stream.sample_rate)
+        pending = []
+        # Windows queued before this recording are no longer relevant
+        if self._pending_mels:
+            self._pending_mels.clear()
+        self._reset_vad()
+        if self._streaming_mel is not None:
+            pending.append(self._feature_worker.submit(self._streaming_mel.reset))
         has_audio = False
 
         while True:
@@ -89,114 +520,163 @@ class SpeechRecognizer:
                 logger.info("Manual stop requested")
                 break
 
-            # Check max recording duration
-            if time.time() - recording_start > MAX_RECORDING_DURATION:
-                logger.info("Max recording duration reached")
-                break
-
-            # Read audio chunk
-            audio_data = audio_stream.read()
-            energy = calculate_energy(audio_data)
+            # Store the next chunk and measure its energy in the same pass
+            end, silent = self._store_chunk(pos, audio_stream.read())
 
             # Track if we've received any actual audio
-            if energy >= self.silence_threshold:
+            if self._is_speech(end, silent):
                 has_audio = True
                 silence_start = None
             elif has_audio:
                 # Only start counting silence after we've had some audio
                 if silence_start is None:
-                    silence_start = time.time()
-                elif time.time() - silence_start > SILENCE_DURATION:
+                    silence_start = pos
+                elif end - silence_start > silence_samples:
                     logger.info("Silence detected, stopping recording")
                     break
 
-            # Collect audio data
-            audio_chunks.append(audio_data)
+            # Keep the chunk, extending the spectrogram as it arrives
+            if self._streaming_mel is not None:
+                pending.append(
+                    self._feature_worker.submit(
+                        self._streaming_mel.append, self._rec_buf[pos:end]
+                    )
+                )
+            pos = end
+            # The buffer is sized to the longest allowed recording
+            if pos == self._rec_buf.size:
+                logger.info("Max recording duration reached")
+                break
 
         # Check if we have enough audio
-        recording_duration = time.time() - recording_start
-        if recording_duration < MIN_RECORDING_DURATION or not has_audio:
+        if pos < min_samples or not has_audio:
             logger.warning("Recording too short or no audio detected")
+            # Finish with the discarded clip before the buffer is reused:
+            # drop queued frames, wait for running ones and surface errors
+            for future in pending:
+                if not future.cancel():
+                    future.result()
+            if pending and self._window.is_cuda:
+                # Uploads from the pinned buffer may still be in flight
+                torch.cuda.current_stream().synchronize()
             return ""
 
-        # Combine all audio chunks
-        audio_bytes = b"".join(audio_chunks)
-        audio_array = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32)
-        audio_array = audio_array / 32768.0  # Normalize to [-1, 1]
+        samples = self._rec_buf[:pos]
 
         # Transcribe with Whisper (suppress progress bar)
-        # Redirect stderr to suppress tqdm progress bars
-        old_stderr = sys.stderr
-        sys.stderr = open(os.devnull, 'w')
-        try:
-            result = self.model.transcribe(
-                audio_array, language="en", fp16=False, verbose=False
-            )
-        finally:
-            sys.stderr.close()
-            sys.stderr = old_stderr
+        with self._silenced():
+            if self._streaming_mel is not None:
+                # Wait for the queued frames, surfacing any worker error
+                for future in pending:
+                    future.result()
+                mel = self._streaming_mel.finalize()
+                transcription = self._decode(self.model, mel, fallback=True).strip()
+            else:
+                transcription = self._transcribe(self.model, samples).strip()
 
-        transcription = result["text"].strip()
         return transcription
 
-    def detect_wake_word(
-        self, audio_stream: AudioStream, wake_word: str = WAKE_WORD
-    ) -> bool:
+    def _trigger_texts(self, samples: Optional[np.ndarray]) -> list[str]:
         """
-        Listen for the wake word in the audio stream.
+        Transcribe a trigger-word window, batching windows when configured.
 
         Args:
-            audio_stream: AudioStream object providing audio data
-            wake_word: Wake word to detect
+            samples: int16 samples of the window, or None if it was silent
 
         Returns:
-            True if wake word detected
+            Lower-cased text of every window decoded by this call, oldest first
         """
-        logger.debug("Listening for wake word...")
+        model = self.trigger_model
+        if self._pending_mels is None:
+            if samples is None:
+                return []
+            return [self._transcribe(model, samples).lower().strip()]
+
+        if samples is not None:
+            mel = self._compute_log_mel(samples, model.dims.n_mels)
+            if mel.is_cuda:
+                # The upload may still be reading the recording buffer,
+                # which the next window overwrites
+                torch.cuda.current_stream().synchronize()
+            self._pending_mels.append(mel)
+            if len(self._pending_mels) < TRIGGER_BATCH_SIZE:
+                return []
+        elif not self._pending_mels:
+            return []
+
+        # Full batch, or silence ended the speech: decode the queued windows
+        texts = self._decode_trigger_batch(self._pending_mels)
+        self._pending_mels.clear()
+        return texts
+
+    def _decode_trigger_batch(self, mels: list[torch.Tensor]) -> list[str]:
+        """
+        Decode up to TRIGGER_BATCH_SIZE trigger-word spectrograms at once.
 
-        # Collect audio for a short period
-        audio_chunks = []
-        wake_word_duration = 2.0  # Listen for 2 seconds at a time
-        start_time = time.time()
+        Args:
+            mels: Log-mel spectrograms, oldest first
 
-        while time.time() - start_time < wake_word_duration:
-            audio_data = audio_stream.read()
-            energy = calculate_energy(audio_data)
+        Returns:
+            Lower-cased text of each spectrogram
+        """
+        # A fixed batch size keeps the compiled encoder on one CUDA graph
+        padding = [self._pad_mel] * (TRIGGER_BATCH_SIZE - len(mels))
+        batch = torch.stack(mels + padding)
+        with torch.no_grad():
+            results = self._decoding_tasks[self.trigger_model].run(batch)
+        return [self._result_text(result).lower().strip() for result in results[: len(mels)]]
+
+    def _listen_for(self, audio_stream: AudioStream, phrases: list[tuple[str, str]]) -> Optional[str]:
+        """
+        Record a short window and look for any of the given phrases in it.
 
-            # Collect all audio, not just above threshold (Whisper handles noise well)
-            audio_chunks.append(audio_data)
+        Args:
+            audio_stream: AudioStream object providing audio data
+            phrases: (label, phrase) pairs, checked in priority order
 
-        if not audio_chunks:
-            return False
+        Returns:
+            Label of the first phrase heard, or None
+        """
+        # Collect audio for a short period
+        window_duration = 2.0  # Listen for 2 seconds at a time
+        pos, has_audio = self._record_window(audio_stream, window_duration)
+
+        # Skip the model entirely for silent windows, the common idle case
+        if not has_audio and not self._pending_mels:
+            return None
 
-        # Combine audio chunks
-        audio_bytes = b"".join(audio_chunks)
-        audio_array = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32)
-        audio_array = audio_array / 32768.0
+        samples = self._rec_buf[:pos] if has_audio else None
 
         # Quick transcription with Whisper (suppress progress bar)
-        old_stderr = sys.stderr
-        sys.stderr = open(os.devnull, 'w')
         try:
-            result = self.model.transcribe(
-                audio_array, language="en", fp16=False, verbose=False
-            )
-            text = result["text"].lower().strip()
-
-            # Normalize wake word for comparison
-            wake_word_normalized = wake_word.lower().strip()
+            with self._silenced():
+                texts = self._trigger_texts(samples)
 
-            if wake_word_normalized in text:
-                # Play wake word detection sound
-                wake_word_detected_sound()
-                return True
+            for text in texts:
+                for label, phrase in phrases:
+                    if phrase.lower().strip() in text:
+                        wake_word_detected_sound()
+                        return label
         except Exception as e:
-            logger.error(f"Error during wake word detection: {e}")
-        finally:
-            sys.stderr.close()
-            sys.stderr = old_stderr
+            logger.error(f"Error during trigger word detection: {e}")
+
+        return None
+
+    def detect_wake_word(
+        self, audio_stream: AudioStream, wake_word: str = WAKE_WORD
+    ) -> bool:
+        """
+        Listen for the wake word in the audio stream.
+
+        Args:
+            audio_stream: AudioStream object providing audio data
+            wake_word: Wake word to detect
 
-        return False
+        Returns:
+            True if wake word detected
+        """
+        logger.debug("Listening for wake word...")
+        return self._listen_for(audio_stream, [("wake", wake_word)]) is not None
 
     def detect_trigger_word(self, audio_stream: AudioStream) -> Optional[str]:
         """
@@ -209,52 +689,8 @@ class SpeechRecognizer:
             "wake" if wake word detected, "paste" if paste word detected, None otherwise
         """
         logger.debug("Listening for trigger words...")
-
-        # Collect audio for a short period
-        audio_chunks = []
-        trigger_word_duration = 2.0  # Listen for 2 seconds at a time
-        start_time = time.time()
-
-        while time.time() - start_time < trigger_word_duration:
-            audio_data = audio_stream.read()
-            audio_chunks.append(audio_data)
-
-        if not audio_chunks:
-            return None
-
-        # Combine audio chunks
-        audio_bytes = b"".join(audio_chunks)
-        audio_array = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32)
-        audio_array = audio_array / 32768.0
-
-        # Quick transcription with Whisper (suppress progress bar)
-        old_stderr = sys.stderr
-        sys.stderr = open(os.devnull, 'w')
-        try:
-            result = self.model.transcribe(
-                audio_array, language="en", fp16=False, verbose=False
-            )
-            text = result["text"].lower().strip()
-
-            # Check for paste word first (higher priority)
-            paste_word_normalized = PASTE_WORD.lower().strip()
-            if paste_word_normalized in text:
-                wake_word_detected_sound()
-                return "paste"
-
-            # Check for wake word
-            wake_word_normalized = WAKE_WORD.lower().strip()
-            if wake_word_normalized in text:
-                wake_word_detected_sound()
-                return "wake"
-
-        except Exception as e:
-            logger.error(f"Error during trigger word detection: {e}")
-        finally:
-            sys.stderr.close()
-            sys.stderr = old_stderr
-
-        return None
+        # Check for paste word first (higher priority)
+        return self._listen_for(audio_stream, [("paste", PASTE_WORD), ("wake", WAKE_WORD)])
 
     def listen_continuous(self, audio_stream: AudioStream, keyboard_trigger: dict = None) -> tuple[Optional[str], str]:
         """